@@ -1,3 +1,4 @@
+import functools
 import warnings
 
 import numpy as np
@@ -26,6 +27,29 @@ from metpy.units import units
 
 from itertools import chain
 
+# Keyword constants shared across calls so the dicts are not rebuilt per
+# call. Lengths and widths are in points and may need to change depending
+# on figure size etc.
+_MAJOR_TICK_KW = {
+    'length': 8,
+    'width': 0.9,
+    'which': 'major',
+    'bottom': True,
+    'top': True,
+    'left': True,
+    'right': True,
+}
+_MINOR_TICK_KW = {
+    'length': 4,
+    'width': 0.4,
+    'which': 'minor',
+    'bottom': True,
+    'top': True,
+    'left': True,
+    'right': True,
+}
+_WHITE_BBOX_KW = {'facecolor': 'white', 'edgecolor': 'none', 'pad': 2}
+
 
 def set_tick_direction_spine_visibility(ax,
                                         tick_direction='out',
@@ -361,6 +385,8 @@ def add_lat_lon_ticklabels(ax: typing.Union[matplotlib.axes.Axes,
     - `NCL_conOncon_2.py <https://geocat-examples.readthedocs.io/en/latest/gallery/Contours/NCL_conOncon_2.html?highlight=add_lat_lon_ticklabels>`_
     """
 
+    # The formatters capture the projection of the axes they are attached
+    # to, so each axes needs its own instances
     lon_formatter = LongitudeFormatter(
         zero_direction_label=zero_direction_label,
         dateline_direction_label=dateline_direction_label)
@@ -426,8 +452,8 @@ def add_major_minor_ticks(ax: typing.Union[matplotlib.axes.Axes,
     - `NCL_scatter_1.py <https://geocat-examples.readthedocs.io/en/latest/gallery/Scatter/NCL_scatter_1.html?highlight=add_major_minor_ticks>`_
     """
 
-    ax.tick_params(labelsize=labelsize)
-    ax.minorticks_on()
+    # Minor ticks are enabled by the explicit locator assignments below, so
+    # no separate minorticks_on call is needed
     if ax.xaxis.get_scale() == 'log':
         ax.xaxis.set_minor_locator(
             tic.LogLocator(base=basex,
@@ -454,27 +480,10 @@ def add_major_minor_ticks(ax: typing.Union[matplotlib.axes.Axes,
     else:
         ax.yaxis.set_minor_locator(tic.AutoMinorLocator(n=y_minor_per_major))
 
-    # length and width are in points and may need to change depending on figure size etc.
-    ax.tick_params(
-        "both",
-        length=8,
-        width=0.9,
-        which="major",
-        bottom=True,
-        top=True,
-        left=True,
-        right=True,
-    )
-    ax.tick_params(
-        "both",
-        length=4,
-        width=0.4,
-        which="minor",
-        bottom=True,
-        top=True,
-        left=True,
-        right=True,
-    )
+    # labelsize only applies to major ticks, matching the former standalone
+    # tick_params(labelsize=...) call
+    ax.tick_params("both", labelsize=labelsize, **_MAJOR_TICK_KW)
+    ax.tick_params("both", **_MINOR_TICK_KW)
 
 
 def set_titles_and_labels(ax: typing.Union[matplotlib.axes.Axes,
@@ -649,23 +658,37 @@ def set_axes_limits_and_ticks(
     - `NCL_xy_4.py <https://geocat-examples.readthedocs.io/en/latest/gallery/XY/NCL_xy_4.html?highlight=set_axes_limits_and_ticks>`_
     """
 
+    # Batch the updates through a single Axes.set call, which applies
+    # properties in keyword order; ticks must precede tick labels so the
+    # fixed locators are in place before the labels are assigned
+    props = {}
+
     if xticks is not None:
-        ax.set_xticks(xticks)
+        props['xticks'] = xticks
 
     if yticks is not None:
-        ax.set_yticks(yticks)
+        props['yticks'] = yticks
 
     if xticklabels is not None:
-        ax.set_xticklabels(xticklabels)
+        props['xticklabels'] = xticklabels
 
     if yticklabels is not None:
-        ax.set_yticklabels(yticklabels)
+        props['yticklabels'] = yticklabels
 
     if xlim is not None:
-        ax.set_xlim(xlim)
+        props['xlim'] = xlim
 
     if ylim is not None:
-        ax.set_ylim(ylim)
+        props['ylim'] = ylim
+
+    if props:
+        ax.set(**props)
+
+
+# Cache of colormaps previously built by truncate_colormap. Colormap
+# objects are not hashable, so entries are keyed on the input colormap's
+# name along with the truncation parameters.
+_truncated_colormaps: dict = {}
 
 
 def truncate_colormap(cmap: matplotlib.colors.Colormap,
@@ -715,9 +738,15 @@ def truncate_colormap(cmap: matplotlib.colors.Colormap,
     """
 
     if not name:
-        name = "trunc({n},{a:.2f},{b:.2f})".format(n=cmap.name,
-                                                   a=minval,
-                                                   b=maxval)
+        name = f"trunc({cmap.name},{minval:.2f},{maxval:.2f})"
+
+    # Return the previously built colormap for repeated identical requests,
+    # skipping the lookup-table construction and re-registration
+    cache_key = (cmap.name, minval, maxval, n, name, force)
+    cached_cmap = _truncated_colormaps.get(cache_key)
+    if cached_cmap is not None:
+        return cached_cmap
+
     new_cmap = mpl.colors.LinearSegmentedColormap.from_list(
         name=name, colors=cmap(np.linspace(minval, maxval)), N=n)
 
@@ -726,9 +755,35 @@ def truncate_colormap(cmap: matplotlib.colors.Colormap,
     except AttributeError:
         mpl.cm.register_cmap(name=name, cmap=new_cmap)
 
+    _truncated_colormaps[cache_key] = new_cmap
+
     return new_cmap
 
 
+@functools.lru_cache(maxsize=16)
+def _cyclic_coord(coord_values: tuple) -> np.ndarray:
+    """Return the cyclic version of an evenly spaced 1D coordinate array.
+
+    Cached so workflows that add cyclic points to many arrays on the
+    same grid (e.g. animations or ensembles) only pay for the spacing
+    check and concatenation once per unique coordinate.
+    """
+
+    coord_arr = np.asarray(coord_values)
+    delta_coord = np.diff(coord_arr)
+    if not np.allclose(delta_coord, delta_coord[0]):
+        raise ValueError('The coordinate must be equally spaced.')
+
+    cyclic = np.concatenate((coord_arr, coord_arr[-1:] + delta_coord[0]))
+
+    # The cached array is shared by every DataArray built on this grid, so
+    # freeze it to keep an in-place edit of one result from corrupting the
+    # cache and the others
+    cyclic.setflags(write=False)
+
+    return cyclic
+
+
 def xr_add_cyclic_longitudes(da: xr.DataArray, coord: str):
     """Utility function to handle the no-shown-data artifact of 0 and
     360-degree longitudes.
@@ -754,15 +809,26 @@ def xr_add_cyclic_longitudes(da: xr.DataArray, coord: str):
     - `NCL_sat_1.py <https://geocat-examples.readthedocs.io/en/latest/gallery/MapProjections/NCL_sat_1.html?highlight=xr_add_cyclic_longitudes>`_
     """
 
-    cyclic_data, cyclic_coord = cutil.add_cyclic_point(da.values,
-                                                       coord=da[coord])
+    coord_da = da[coord]
+    if coord_da.ndim == 1 and da.shape[-1] == coord_da.size:
+        # Common case: wrap the trailing longitude dimension directly. The
+        # coordinate handling is invariant across arrays on the same grid,
+        # so it is served from a cache.
+        cyclic_coord = _cyclic_coord(tuple(float(v) for v in coord_da.values))
+        cyclic_data = np.ma.concatenate((da.data, da.data[..., :1]), axis=-1)
+    else:
+        # Let cartopy diagnose unsupported coordinate layouts
+        cyclic_data, cyclic_coord = cutil.add_cyclic_point(da.data,
+                                                           coord=coord_da)
 
-    coords = da.coords.to_dataset()
-    coords[coord] = cyclic_coord
+    # Swap in the cyclic coordinate directly rather than round-tripping
+    # every coordinate through a temporary Dataset
+    new_coords = {k: v for k, v in da.coords.items() if k != coord}
+    new_coords[coord] = cyclic_coord
 
     new_da = xr.DataArray(cyclic_data,
                           dims=da.dims,
-                          coords=coords.coords,
+                          coords=new_coords,
                           attrs=da.attrs)
     new_da.encoding = da.encoding
 
@@ -953,7 +1019,8 @@ def findLocalExtrema(da: xr.DataArray,
 
     warnings.warn(
         'This function is deprecated. Call `find_local_extrema` instead.',
-        PendingDeprecationWarning)
+        PendingDeprecationWarning,
+        stacklevel=2)
 
     return find_local_extrema(da, highVal, lowVal, eType, eps)
 
@@ -1006,24 +1073,22 @@ def find_local_extrema(da: xr.DataArray,
     - `NCL_sat_2.py <https://geocat-examples.readthedocs.io/en/latest/gallery/MapProjections/NCL_sat_2.html?highlight=findlocalextrema>`_
     """
 
-    # Create a 2D array of coordinates in the same shape as the field variable data
-    # so each coordinate is easily mappable to a data value
-    # ex:
-    # (1, 1), (2, 1), (3, 1)
-    # (1, 2)................
-    # (1, 3)................
-    lons, lats = np.meshgrid(np.array(da.lon), np.array(da.lat))
-    coordarr = np.dstack((lons, lats))
+    # Pull the 1D coordinate arrays out once; the grid indices returned by
+    # np.argwhere map directly onto them, so no 2D array of coordinate
+    # pairs needs to be materialized
+    lons = np.asarray(da.lon.values)
+    lats = np.asarray(da.lat.values)
 
     # Find all zeroes that also qualify as low or high values
     extremacoords = []
+    coordlist = []
 
     if eType == 'Low':
         coordlist = np.argwhere(da.data < lowVal)
-        extremacoords = [tuple(coordarr[x[0]][x[1]]) for x in coordlist]
+        extremacoords = [(lons[x[1]], lats[x[0]]) for x in coordlist]
     if eType == 'High':
         coordlist = np.argwhere(da.data > highVal)
-        extremacoords = [tuple(coordarr[x[0]][x[1]]) for x in coordlist]
+        extremacoords = [(lons[x[1]], lats[x[0]]) for x in coordlist]
 
     if extremacoords == []:
         if eType == 'Low':
@@ -1044,10 +1109,13 @@ def find_local_extrema(da: xr.DataArray,
     labels = new.labels_
 
     # Create an dictionary of values with key being coordinate
-    # and value being cluster label.
+    # and value being cluster label. Keep the grid indices of each
+    # coordinate alongside so data values can be read back directly.
     coordsAndLabels = {label: [] for label in labels}
-    for label, coord in zip(labels, extremacoords):
+    indicesAndLabels = {label: [] for label in labels}
+    for label, coord, index in zip(labels, extremacoords, coordlist):
         coordsAndLabels[label].append(coord)
+        indicesAndLabels[label].append(index)
 
     # Initialize array of coordinates to be returned
     clusterExtremas = []
@@ -1055,14 +1123,8 @@ def find_local_extrema(da: xr.DataArray,
     # Iterate through the coordinates in each cluster
     for key in coordsAndLabels:
 
-        # Create array to hold all the field variable values for that cluster
-        data_vals = []
-        for coord in coordsAndLabels[key]:
-            # Find pressure data at that coordinate
-            cond = np.logical_and(coordarr[:, :, 0] == coord[0],
-                                  coordarr[:, :, 1] == coord[1])
-            x, y = np.where(cond)
-            data_vals.append(da.data[x[0]][y[0]])
+        # Gather the field variable values for that cluster
+        data_vals = [da.data[x[0], x[1]] for x in indicesAndLabels[key]]
 
         # Find the index of the smallest/greatest field variable value of each cluster
         if eType == 'Low':
@@ -1137,7 +1199,8 @@ def plotCLabels(ax: matplotlib.axes.Axes,
 
     warnings.warn(
         'This function is  deprecated. Call `plot_contour_labels` instead.',
-        PendingDeprecationWarning)
+        PendingDeprecationWarning,
+        stacklevel=2)
 
     return plot_contour_labels(ax, contours, transform, proj, clabel_locations,
                                fontsize, whitebbox, horizontal)
@@ -1150,7 +1213,8 @@ def plot_contour_labels(ax: matplotlib.axes.Axes,
                         clabel_locations: list = [],
                         fontsize: int = 12,
                         whitebbox: bool = False,
-                        horizontal: bool = False) -> list:
+                        horizontal: bool = False,
+                        out: list = None) -> list:
     """Utility function to plot contour labels by passing in a coordinate to
     the clabel function.
 
@@ -1187,6 +1251,11 @@ def plot_contour_labels(ax: matplotlib.axes.Axes,
     horizontal : bool
         Setting this to "True" will cause the contour labels to be horizontal.
 
+    out : list
+        Optional existing list to collect the label text instances in. If given, it is extended
+        in place and returned, which avoids allocating a new list when labeling several contour
+        sets.
+
     Returns
     -------
     cLabels : list
@@ -1201,14 +1270,15 @@ def plot_contour_labels(ax: matplotlib.axes.Axes,
     - `NCL_sat_1.py <https://geocat-examples.readthedocs.io/en/latest/gallery/MapProjections/NCL_sat_1.html?highlight=plotCLabels>`_
     """
 
-    # Initialize empty array that will be filled with contour label text objects and returned
-    cLabels = []
+    # Collect contour label text objects in the caller-supplied list if one
+    # was given, otherwise in a fresh list
+    cLabels = out if out is not None else []
 
     # Plot any regular contour levels
     if clabel_locations != []:
-        clevelpoints = proj.transform_points(
-            transform, np.array([x[0] for x in clabel_locations]),
-            np.array([x[1] for x in clabel_locations]))
+        location_arr = np.asarray(clabel_locations, dtype=float)
+        clevelpoints = proj.transform_points(transform, location_arr[:, 0],
+                                             location_arr[:, 1])
         transformed_locations = [(x[0], x[1]) for x in clevelpoints]
         ax.clabel(contours,
                   manual=transformed_locations,
@@ -1216,16 +1286,16 @@ def plot_contour_labels(ax: matplotlib.axes.Axes,
                   fontsize=fontsize,
                   colors='black',
                   fmt='%.0f')
-        [cLabels.append(txt) for txt in contours.labelTexts]
+        cLabels.extend(contours.labelTexts)
 
         if horizontal is True:
-            [txt.set_rotation('horizontal') for txt in contours.labelTexts]
+            for txt in contours.labelTexts:
+                txt.set_rotation('horizontal')
 
     if whitebbox is True:
-        [
-            txt.set_bbox(dict(facecolor='white', edgecolor='none', pad=2))
-            for txt in cLabels
-        ]
+        # matplotlib copies the bbox properties, so the shared dict is safe
+        for txt in cLabels:
+            txt.set_bbox(_WHITE_BBOX_KW)
 
     return cLabels
 
@@ -1292,12 +1362,49 @@ def plotELabels(da: xr.DataArray,
 
     warnings.warn(
         'This function is deprecated. Please use `plot_extrema_labels` instead.',
-        PendingDeprecationWarning)
+        PendingDeprecationWarning,
+        stacklevel=2)
 
     return plot_extrema_labels(da, transform, proj, clabel_locations, label,
                                fontsize, whitebbox, horizontal)
 
 
+def _find_nearest_indices(lons: np.ndarray,
+                          lats: np.ndarray,
+                          lon: float,
+                          lat: float,
+                          atol: float = 1e-6) -> typing.Optional[tuple]:
+    """Locate the grid indices nearest to a (lon, lat) coordinate.
+
+    Parameters
+    ----------
+    lons, lats : :class:`numpy.ndarray`
+        1D longitude and latitude coordinate arrays of the grid.
+
+    lon, lat : float
+        Coordinate to look up, in the same units as "lons" and "lats".
+
+    atol : float
+        Maximum distance between the coordinate and the nearest grid point
+        for the lookup to count as a match. Absorbs floating point drift
+        introduced by coordinate transformations.
+
+    Returns
+    -------
+    indices : tuple, None
+        A (lat index, lon index) tuple, or None if the coordinate does not
+        fall on the grid within "atol".
+    """
+
+    lon_index = int(np.abs(lons - lon).argmin())
+    lat_index = int(np.abs(lats - lat).argmin())
+
+    if (abs(lons[lon_index] - lon) > atol or abs(lats[lat_index] - lat) > atol):
+        return None
+
+    return lat_index, lon_index
+
+
 def plot_extrema_labels(da: xr.DataArray,
                         transform: cartopy.crs.CRS,
                         proj: cartopy.crs.CRS,
@@ -1360,22 +1467,19 @@ def plot_extrema_labels(da: xr.DataArray,
     - `NCL_sat_2.py <https://geocat-examples.readthedocs.io/en/latest/gallery/MapProjections/NCL_sat_2.html?highlight=plotELabels>`_
     """
 
-    # Create array of coordinates in the same shape as field variable data
-    # so each coordinate can be easily mapped to its data value.
-    # ex:
-    # (1, 1), (2, 1), (3, 1)
-    # (1, 2)................
-    # (1, 3)................
-    lons, lats = np.meshgrid(np.array(da.lon), np.array(da.lat))
-    coordarr = np.dstack((lons, lats))
+    # Pull the 1D coordinate arrays out once so each label location can be
+    # mapped to its data value with a direct index lookup instead of a
+    # comparison against every grid coordinate
+    lons = np.asarray(da.lon.values)
+    lats = np.asarray(da.lat.values)
 
     # Initialize empty array that will be filled with contour label text objects and returned
     extremaLabels = []
 
     # Plot any low contour levels
-    clabel_points = proj.transform_points(
-        transform, np.array([x[0] for x in label_locations]),
-        np.array([x[1] for x in label_locations]))
+    location_arr = np.asarray(label_locations, dtype=float).reshape(-1, 2)
+    clabel_points = proj.transform_points(transform, location_arr[:, 0],
+                                          location_arr[:, 1])
     transformed_locations = [(x[0], x[1]) for x in clabel_points]
 
     nan_indices = [
@@ -1386,6 +1490,9 @@ def plot_extrema_labels(da: xr.DataArray,
         loc for i, loc in enumerate(transformed_locations)
         if i not in nan_indices
     ]
+    kept_locations = [
+        loc for i, loc in enumerate(label_locations) if i not in nan_indices
+    ]
 
     if show_warnings:
         bad_locations = [label_locations[i] for i in nan_indices]
@@ -1395,19 +1502,50 @@ def plot_extrema_labels(da: xr.DataArray,
                 f'The following locations could not be translated into the desired projection: {bad_locations_str}. These locations will be dropped.',
                 stacklevel=2)
 
-    for loc in range(len(transformed_locations)):
+    # Resolve each label location to its grid indices up front, dropping
+    # locations that do not fall on the grid
+    text_locations = []
+    lat_indices = []
+    lon_indices = []
+    missed_locations = []
+    for trans_loc, coord in zip(transformed_locations, kept_locations):
+        indices = _find_nearest_indices(lons, lats, coord[0], coord[1])
+        if indices is None:
+            missed_locations.append(coord)
+            continue
+        text_locations.append(trans_loc)
+        lat_indices.append(indices[0])
+        lon_indices.append(indices[1])
 
-        try:
-            # Find field variable data at that coordinate
-            coord = label_locations[loc]
-            cond = np.logical_and(coordarr[:, :, 0] == coord[0],
-                                  coordarr[:, :, 1] == coord[1])
-            z_loc, y_loc = np.where(cond)
-            p_loc = int(round(da.data[z_loc[0]][y_loc[0]]))
+    if show_warnings:
+        missed_locations_str = ", ".join([str(loc) for loc in missed_locations])
+        if len(missed_locations) > 0:
+            warnings.warn(
+                f'The following locations do not fall on the data grid: {missed_locations_str}. These locations will be dropped.',
+                stacklevel=2)
 
-            lab = plt.text(transformed_locations[loc][0],
-                           transformed_locations[loc][1],
-                           label + '$_{' + str(p_loc) + '}$',
+    if text_locations:
+        # Gather all the label data values in one vectorized read so lazily
+        # backed arrays (e.g. dask) evaluate a single task graph instead of
+        # one chunk per label
+        values = da.isel(lat=xr.DataArray(lat_indices, dims='points'),
+                         lon=xr.DataArray(lon_indices, dims='points')).values
+
+        # Drop labels whose data value is not finite; NaN cannot be cast
+        # to an integer label
+        finite = np.isfinite(values)
+        if not finite.all():
+            values = values[finite]
+            text_locations = [
+                loc for loc, keep in zip(text_locations, finite) if keep
+            ]
+
+        p_values = np.round(values).astype(int)
+
+        for (x, y), p_loc in zip(text_locations, p_values):
+            lab = plt.text(x,
+                           y,
+                           f"{label}$_{{{p_loc}}}$",
                            fontsize=fontsize,
                            horizontalalignment='center',
                            verticalalignment='center')
@@ -1417,15 +1555,10 @@ def plot_extrema_labels(da: xr.DataArray,
 
             extremaLabels.append(lab)
 
-        except Exception as E:
-            print(E)
-            continue
-
     if whitebbox is True:
-        [
-            txt.set_bbox(dict(facecolor='white', edgecolor='none', pad=2))
-            for txt in extremaLabels
-        ]
+        # matplotlib copies the bbox properties, so the shared dict is safe
+        for txt in extremaLabels:
+            txt.set_bbox(_WHITE_BBOX_KW)
 
     return extremaLabels
 
@@ -1577,22 +1710,26 @@ def get_skewt_vars(pressure: Quantity = None,
         pressure = p
         warnings.warn(
             'The keyword argument `p` is deprecated. Use `pressure` instead.',
-            PendingDeprecationWarning)
+            PendingDeprecationWarning,
+            stacklevel=2)
     if tc:
         temperature = tc
         warnings.warn(
             'The keyword argument `tc` is deprecated. Use `temperature` instead.',
-            PendingDeprecationWarning)
+            PendingDeprecationWarning,
+            stacklevel=2)
     if tdc:
         dewpoint = tdc
         warnings.warn(
             'The keyword argument `tdc` is deprecated. Use `dewpoint` instead.',
-            PendingDeprecationWarning)
+            PendingDeprecationWarning,
+            stacklevel=2)
     if pro:
         profile = pro
         warnings.warn(
             'The keyword argument `pro` is deprecated. Use `profile` instead.',
-            PendingDeprecationWarning)
+            PendingDeprecationWarning,
+            stacklevel=2)
 
     # CAPE
     cape = mpcalc.cape_cin(pressure, temperature, dewpoint, profile)